@@ -73,6 +73,32 @@ def longitude_bounds(longitudes):
     return lower_bound, upper_bound
 
 
+def bounding_box(locations):
+    """
+    Smallest (latitude, longitude) box containing every location
+
+    Unlike :func:`latitude_bounds` and :func:`longitude_bounds`, this
+    does not pad the bounds or account for longitudes wrapping around.
+    Returns the (south-west, north-east) corners of the box.
+    """
+    locations = iter(locations)
+    try:
+        min_latitude, min_longitude = max_latitude, max_longitude = \
+            next(locations)
+    except StopIteration:
+        raise ValueError('bounding_box requires at least one location')
+    for latitude, longitude in locations:
+        if latitude < min_latitude:
+            min_latitude = latitude
+        elif latitude > max_latitude:
+            max_latitude = latitude
+        if longitude < min_longitude:
+            min_longitude = longitude
+        elif longitude > max_longitude:
+            max_longitude = longitude
+    return (min_latitude, min_longitude), (max_latitude, max_longitude)
+
+
 def merge_longitude_bounds(longitude_bounds_list):
     """
     Return a single set of bounds that encompasses a list of bounds
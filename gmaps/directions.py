@@ -1,27 +1,35 @@
 
+import contextlib
+import itertools
 import ipywidgets as widgets
+import operator
 import warnings
 
+from six import string_types
 from traitlets import (
-    Bool, Unicode, CUnicode, List, Enum, observe, validate, Float
+    Any, Bool, Unicode, CUnicode, List, Enum, observe, validate, Float,
+    TraitError
 )
 
+from . import bounds
 from . import geotraitlets
 from .maps import GMapsWidgetMixin
 from ._docutils import doc_subst
 
 
-ALLOWED_TRAVEL_MODES = {'BICYCLING', 'DRIVING', 'TRANSIT', 'WALKING'}
+ALLOWED_TRAVEL_MODES = frozenset(
+    {'BICYCLING', 'DRIVING', 'TRANSIT', 'WALKING'})
 DEFAULT_TRAVEL_MODE = 'DRIVING'
 
 DEFAULT_STROKE_COLOR = '#0088FF'
 
 
-def _warn_obsolete_data():
+def _warn_obsolete_data(stacklevel=1):
     warnings.warn(
         'The "data" traitlet is deprecated, and will be '
         'removed in jupyter-gmaps 0.9.0. '
-        'Use "locations" instead.', DeprecationWarning)
+        'Use "locations" instead.', DeprecationWarning,
+        stacklevel=stacklevel + 1)
 
 
 def _warn_obsolete_waypoints():
@@ -166,7 +174,7 @@ class Directions(GMapsWidgetMixin, widgets.Widget):
     start = geotraitlets.Point().tag(sync=True)
     end = geotraitlets.Point().tag(sync=True)
     waypoints = geotraitlets.LocationArray().tag(sync=True)
-    data = List(minlen=2, allow_none=True, default_value=None)
+    data = Any(allow_none=True, default_value=None)
     data_bounds = List().tag(sync=True)
     avoid_ferries = Bool(default_value=False).tag(sync=True)
     avoid_highways = Bool(default_value=False).tag(sync=True)
@@ -186,14 +194,22 @@ class Directions(GMapsWidgetMixin, widgets.Widget):
 
     layer_status = CUnicode().tag(sync=True)
 
+    # Set while the data trait changes start, end and waypoints
+    # together, so the bounds are only computed once. This is not
+    # needed in the constructor: traitlets already holds notifications
+    # there, and the bounds must be final before the comm opens.
+    _bounds_held = False
+
     def __init__(self, start=None, end=None, waypoints=None, **kwargs):
         if kwargs.get('data') is not None:
-            _warn_obsolete_data()
+            # Point the warning at the code constructing the layer
+            _warn_obsolete_data(stacklevel=2)
             # Keep for backwards compatibility with data argument
             data = kwargs['data']
             waypoints = kwargs.get('waypoints')
             if start is None and end is None and waypoints is None:
-                start, end, waypoints = Directions._destructure_data(data)
+                start, end, waypoints = Directions._destructure_data(
+                    Directions._data_as_list(data))
                 kwargs.update(
                     dict(start=start, end=end, waypoints=waypoints, data=None))
             else:
@@ -206,6 +222,21 @@ class Directions(GMapsWidgetMixin, widgets.Widget):
             kwargs.update(dict(start=start, end=end, waypoints=waypoints))
         super(Directions, self).__init__(**kwargs)
 
+    @staticmethod
+    def _data_as_list(data):
+        # Materialize once so generators and arrays are sliced like lists
+        try:
+            data = list(data)
+        except TypeError:
+            raise TraitError(
+                'data must be an iterable of locations, '
+                'got {}.'.format(data))
+        if len(data) < 2:
+            raise TraitError(
+                'data must contain at least two locations, '
+                'got {}.'.format(len(data)))
+        return data
+
     @staticmethod
     def _destructure_data(data):
         start = data[0]
@@ -213,6 +244,12 @@ class Directions(GMapsWidgetMixin, widgets.Widget):
         waypoints = data[1:-1]
         return start, end, waypoints
 
+    @validate('data')
+    def _valid_data(self, proposal):
+        if proposal['value'] is None:
+            return None
+        return self._data_as_list(proposal['value'])
+
     @validate('waypoints')
     def _valid_waypoints(self, proposal):
         if proposal['value'] is None:
@@ -225,21 +262,61 @@ class Directions(GMapsWidgetMixin, widgets.Widget):
         data = change['new']
         if data is not None:
             _warn_obsolete_data()
-            with self.hold_trait_notifications():
+            with self._hold_bounds(), self.hold_trait_notifications():
                 self.start, self.end, self.waypoints = \
                         self._destructure_data(data)
 
+    @contextlib.contextmanager
+    def _hold_bounds(self):
+        self._bounds_held = True
+        try:
+            yield
+        finally:
+            self._bounds_held = False
+        self._update_bounds()
+
     @observe('start', 'end', 'waypoints')
     def _calc_bounds(self, change):
-        all_data = [self.start] + self.waypoints + [self.end]
-        min_latitude = min(row[0] for row in all_data)
-        min_longitude = min(row[1] for row in all_data)
-        max_latitude = max(row[0] for row in all_data)
-        max_longitude = max(row[1] for row in all_data)
-        self.data_bounds = [
-            (min_latitude, min_longitude),
-            (max_latitude, max_longitude)
-        ]
+        if not self._bounds_held and not self._extend_bounds(change):
+            self._update_bounds()
+
+    def _extend_bounds(self, change):
+        """
+        Update the bounds from a single change, without visiting every point
+
+        This is possible when waypoints are appended, or when the start or
+        end moves from strictly inside the current bounds. Returns False if
+        the bounds need to be recomputed from scratch.
+        """
+        if not self.data_bounds or self.start is None or self.end is None:
+            return False
+        old, new = change['old'], change['new']
+        if change['name'] == 'waypoints':
+            # Checking that the old waypoints are a prefix of the new ones
+            # is still linear, as is validating the new waypoints, but it
+            # runs in C without copying the list. What this saves is the
+            # Python-level min/max loop over the whole route.
+            if not isinstance(old, list) or len(new) < len(old) or \
+                    not all(map(operator.eq, old, new)):
+                return False
+            added = new[len(old):]
+        else:
+            (south, west), (north, east) = self.data_bounds
+            if old is None or not (
+                    south < old[0] < north and west < old[1] < east):
+                return False
+            added = [new]
+        south_west, north_east = bounds.bounding_box(
+            itertools.chain(self.data_bounds, added))
+        self.data_bounds = [south_west, north_east]
+        return True
+
+    def _update_bounds(self):
+        if self.start is None or self.end is None:
+            return
+        south_west, north_east = bounds.bounding_box(
+            itertools.chain((self.start,), self.waypoints, (self.end,)))
+        self.data_bounds = [south_west, north_east]
 
 
 @doc_subst(_doc_snippets)
@@ -264,19 +341,23 @@ def directions_layer(
     :returns:
         A :class:`gmaps.Directions` widget.
     """
-    kwargs = {
-        'start': start,
-        'end': end,
-        'waypoints': waypoints,
-        'travel_mode': travel_mode,
-        'avoid_ferries': avoid_ferries,
-        'avoid_highways': avoid_highways,
-        'avoid_tolls': avoid_tolls,
-        'optimize_waypoints': optimize_waypoints,
-        'show_markers': show_markers,
-        'show_route': show_route,
-        'stroke_color': stroke_color,
-        'stroke_weight': stroke_weight,
-        'stroke_opacity': stroke_opacity
-    }
-    return Directions(**kwargs)
+    if not isinstance(travel_mode, string_types) or \
+            travel_mode not in ALLOWED_TRAVEL_MODES:
+        raise ValueError(
+            'Invalid travel mode {}. Travel mode must be one of {}.'.format(
+                travel_mode, ', '.join(sorted(ALLOWED_TRAVEL_MODES))))
+    return Directions(
+        start=start,
+        end=end,
+        waypoints=waypoints,
+        travel_mode=travel_mode,
+        avoid_ferries=avoid_ferries,
+        avoid_highways=avoid_highways,
+        avoid_tolls=avoid_tolls,
+        optimize_waypoints=optimize_waypoints,
+        show_markers=show_markers,
+        show_route=show_route,
+        stroke_color=stroke_color,
+        stroke_weight=stroke_weight,
+        stroke_opacity=stroke_opacity
+    )
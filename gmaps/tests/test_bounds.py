@@ -4,7 +4,7 @@ import unittest
 import numpy as np
 
 from ..bounds import (
-    latitude_bounds, longitude_bounds, merge_longitude_bounds,
+    bounding_box, latitude_bounds, longitude_bounds, merge_longitude_bounds,
     MAX_ALLOWED_LATITUDE, MIN_ALLOWED_LATITUDE, EPSILON
 )
 
@@ -160,3 +160,27 @@ class MergeLongitudeBounds(unittest.TestCase):
 
     def test_verify_no_bounds(self):
         self._verify_bounds([], -180.0, -180.0)
+
+
+class BoundingBox(unittest.TestCase):
+
+    def test_bounding_box(self):
+        locations = [(51.0, 1.0), (52.0, 1.0), (52.0, 0.0), (50.0, 2.0)]
+        south_west, north_east = bounding_box(locations)
+        assert south_west == (50.0, 0.0)
+        assert north_east == (52.0, 2.0)
+
+    def test_single_location(self):
+        south_west, north_east = bounding_box([(10.0, 20.0)])
+        assert south_west == (10.0, 20.0)
+        assert north_east == (10.0, 20.0)
+
+    def test_iterator(self):
+        locations = iter([(10.0, -20.0), (-10.0, 20.0)])
+        south_west, north_east = bounding_box(locations)
+        assert south_west == (-10.0, -20.0)
+        assert north_east == (10.0, 20.0)
+
+    def test_no_locations(self):
+        with self.assertRaises(ValueError):
+            bounding_box([])
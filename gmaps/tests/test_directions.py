@@ -1,10 +1,15 @@
 
 import unittest
+import warnings
+
+import numpy as np
 import pytest
 
 import traitlets
 
-from ..directions import Directions, DEFAULT_STROKE_COLOR
+from ..directions import (
+    Directions, directions_layer, DEFAULT_STROKE_COLOR
+)
 
 
 class DirectionsLayer(unittest.TestCase):
@@ -46,6 +51,50 @@ class DirectionsLayer(unittest.TestCase):
         assert layer.end == self.end
         assert layer.waypoints == self.waypoints
 
+    # Using the data traitlet is deprecated
+    @pytest.mark.filterwarnings("ignore::DeprecationWarning")
+    def test_set_data_numpy_array(self):
+        layer = Directions(data=np.array(self.data_array))
+        assert layer.start == self.start
+        assert layer.end == self.end
+        assert layer.waypoints == self.waypoints
+
+    # Using the data traitlet is deprecated
+    @pytest.mark.filterwarnings("ignore::DeprecationWarning")
+    def test_set_data_generator(self):
+        layer = Directions(data=(point for point in self.data_array))
+        assert layer.start == self.start
+        assert layer.end == self.end
+        assert layer.waypoints == self.waypoints
+
+    # Using the data traitlet is deprecated
+    @pytest.mark.filterwarnings("ignore::DeprecationWarning")
+    def test_change_data_generator(self):
+        layer = Directions(self.start, self.end)
+        layer.data = (point for point in self.data_array)
+        assert layer.data == self.data_array
+        assert layer.start == self.start
+        assert layer.end == self.end
+        assert layer.waypoints == self.waypoints
+
+    # Using the data traitlet is deprecated
+    @pytest.mark.filterwarnings("ignore::DeprecationWarning")
+    def test_data_too_short(self):
+        layer = Directions(self.start, self.end)
+        with self.assertRaises(traitlets.TraitError):
+            layer.data = [self.start]
+        assert layer.data is None
+
+    # Using the data traitlet is deprecated
+    @pytest.mark.filterwarnings("ignore::DeprecationWarning")
+    def test_data_not_iterable(self):
+        layer = Directions(self.start, self.end)
+        with self.assertRaises(traitlets.TraitError):
+            layer.data = 5
+        assert layer.data is None
+        with self.assertRaises(traitlets.TraitError):
+            Directions(data=5)
+
     # Using the start and end traitlets is deprecated
     @pytest.mark.filterwarnings("ignore::DeprecationWarning")
     def test_change_data(self):
@@ -85,6 +134,14 @@ class DirectionsLayer(unittest.TestCase):
         layer = Directions(self.start, self.end, waypoints=None)
         assert layer.get_state()['waypoints'] == []
 
+    def test_obsolete_data_warning_stacklevel(self):
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            Directions(data=self.data_array)
+        assert len(w) == 1
+        assert issubclass(w[0].category, DeprecationWarning)
+        assert w[0].filename == __file__
+
     def test_boolean_options(self):
         layer = Directions(
             self.start, self.end,
@@ -148,3 +205,70 @@ class DirectionsLayer(unittest.TestCase):
     def test_invalid_opacity(self):
         with self.assertRaises(traitlets.TraitError):
             Directions(self.start, self.end, stroke_opacity=20.0)
+
+    def test_data_bounds(self):
+        layer = Directions(self.start, self.end, self.waypoints)
+        assert layer.data_bounds == [(50.0, 0.0), (52.0, 2.0)]
+
+    def test_data_bounds_set_when_comm_opens(self):
+        opened_bounds = []
+
+        class RecordingDirections(Directions):
+            def open(self):
+                opened_bounds.append(self.get_state()['data_bounds'])
+                super(RecordingDirections, self).open()
+
+        RecordingDirections(self.start, self.end, self.waypoints)
+        assert opened_bounds == [[(50.0, 0.0), (52.0, 2.0)]]
+
+    def test_data_bounds_change_waypoints(self):
+        layer = Directions(self.start, self.end)
+        assert layer.data_bounds == [(50.0, 1.0), (51.0, 2.0)]
+        layer.waypoints = self.waypoints
+        assert layer.data_bounds == [(50.0, 0.0), (52.0, 2.0)]
+
+    def test_data_bounds_append_waypoints(self):
+        layer = Directions(self.start, self.end, self.waypoints)
+        layer.waypoints = self.waypoints + [(53.0, 0.5)]
+        assert layer.data_bounds == [(50.0, 0.0), (53.0, 2.0)]
+
+    def test_data_bounds_remove_waypoints(self):
+        layer = Directions(self.start, self.end, self.waypoints)
+        layer.waypoints = self.waypoints[:1]
+        assert layer.data_bounds == [(50.0, 1.0), (52.0, 2.0)]
+
+    def test_data_bounds_change_start(self):
+        layer = Directions(self.start, self.end, self.waypoints)
+        layer.start = (49.0, 1.0)
+        assert layer.data_bounds == [(49.0, 0.0), (52.0, 2.0)]
+        layer.start = (51.0, 1.0)
+        assert layer.data_bounds == [(50.0, 0.0), (52.0, 2.0)]
+
+    def test_data_bounds_change_end(self):
+        layer = Directions(self.start, self.end, self.waypoints)
+        layer.end = (51.5, 0.5)
+        assert layer.data_bounds == [(51.0, 0.0), (52.0, 1.0)]
+
+    # Using the data traitlet is deprecated
+    @pytest.mark.filterwarnings("ignore::DeprecationWarning")
+    def test_data_bounds_change_data(self):
+        layer = Directions(start=(0.0, 0.0), end=(2.0, 2.0))
+        layer.data = self.data_array
+        assert layer.data_bounds == [(50.0, 0.0), (52.0, 2.0)]
+
+
+class DirectionsFactory(unittest.TestCase):
+
+    def setUp(self):
+        self.start = (51.0, 1.0)
+        self.end = (50.0, 2.0)
+
+    def test_travel_mode(self):
+        layer = directions_layer(self.start, self.end, travel_mode='WALKING')
+        assert layer.travel_mode == 'WALKING'
+
+    def test_invalid_travel_mode(self):
+        for travel_mode in ['wrong', 'walking', None, 3, []]:
+            with self.assertRaises(ValueError):
+                directions_layer(
+                    self.start, self.end, travel_mode=travel_mode)